@@ -2,17 +2,18 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import os
+import time
+import itertools
 from datetime import datetime, timedelta
-import threading
+from collections import deque
+import bisect
+import math
 import sys
 
-try:
-    import pygame
-    pygame.mixer.init()
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
-    print("Warning: pygame library not found. Sound notifications will use system beep. Install with 'pip install pygame'.")
+# pygame and plyer are heavy to import and initialise, so they are loaded on
+# the first reminder. None means "not tried yet".
+PYGAME_AVAILABLE = None
+PLYER_AVAILABLE = None
 
 try:
     import winsound
@@ -20,12 +21,56 @@ try:
 except ImportError:
     WINSOUND_AVAILABLE = False
 
-try:
-    from plyer import notification
-    PLYER_AVAILABLE = True
-except ImportError:
-    PLYER_AVAILABLE = False
-    print("Warning: plyer library not found. Desktop notifications will be disabled. Install with 'pip install plyer'.")
+def _ensure_audio():
+    """Imports pygame and initialises the mixer on first use."""
+    global pygame, PYGAME_AVAILABLE
+    if PYGAME_AVAILABLE is None:
+        try:
+            import pygame
+        except ImportError:
+            PYGAME_AVAILABLE = False
+            print("Warning: pygame library not found. Sound notifications will use system beep. Install with 'pip install pygame'.")
+            return PYGAME_AVAILABLE
+        try:
+            pygame.mixer.init()
+            PYGAME_AVAILABLE = True
+        except pygame.error as e:
+            # e.g. no audio device; fall back to the other sound options for good
+            PYGAME_AVAILABLE = False
+            print(f"Warning: could not initialise pygame mixer ({e}). Sound notifications will use system beep.")
+    return PYGAME_AVAILABLE
+
+def _ensure_notifier():
+    """Imports plyer's notification backend on first use."""
+    global notification, PLYER_AVAILABLE
+    if PLYER_AVAILABLE is None:
+        try:
+            from plyer import notification
+            PLYER_AVAILABLE = True
+        except ImportError:
+            PLYER_AVAILABLE = False
+            print("Warning: plyer library not found. Desktop notifications will be disabled. Install with 'pip install plyer'.")
+    return PLYER_AVAILABLE
+
+# Choices for the "Remind before" dropdowns
+_HOURS = tuple(str(i) for i in range(24))
+_MINUTES = tuple(str(i) for i in range(0, 60, 5))  # 5-minute intervals
+
+# Extra rows materialised below the visible part of the task list
+ROW_OVERSCAN = 5
+
+# Upper bound on how long the reminder timer sleeps before re-checking
+REMINDER_MAX_WAIT_MS = 60 * 60 * 1000
+# How long task changes are buffered before being written to disk
+SAVE_DELAY_MS = 30 * 1000
+
+def _deadline_key(task):
+    """Sort key that keeps the task list ordered by deadline."""
+    return task["_deadline_dt"]
+
+def _is_pending(task):
+    """True if the task still has a reminder waiting to fire."""
+    return not task["completed"] and not task.get("reminded", False)
 
 class ToDoApp(tk.Tk):
     """
@@ -38,11 +83,34 @@ class ToDoApp(tk.Tk):
         
         self.task_file = "tasks.json"
         self.tasks = self.load_tasks()
+        self.tasks_by_id = {task["id"]: task for task in self.tasks}
+        # Number of tasks whose reminder has not fired yet
+        self._pending_count = sum(1 for task in self.tasks if _is_pending(task))
+        # Longest gap between a reminder and its deadline; bounds the reminder scan.
+        # Taken from the actual tasks, since tasks.json may hold any lead time
+        self._max_reminder_lead = max((task["_deadline_dt"] - task["_reminder_dt"] for task in self.tasks),
+                                      default=timedelta(0))
+        self._id_counter = itertools.count()
+        self._reminder_after_id = None
+        self._dirty = False
+        self._save_after_id = None
+        self._alarm_sound = None
+        self._alarm_sound_loaded = False
+        self._pending_popups = deque()
+        self._popup_window = None
+        # Only the slice self.tasks[start:end] exists as Treeview rows
+        self._row_window = (0, 0)
+        self._scroll_start = 0
+        self._visible_rows = 10
+        # Tree height at which _visible_rows was last measured exactly
+        self._measured_height = None
+        self._selected_id = None
 
         self.create_widgets()
         self.refresh_task_list()
         self.check_reminders()
         self.update_clock()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def create_widgets(self):
         """Initializes and places all GUI widgets."""
@@ -80,18 +148,14 @@ class ToDoApp(tk.Tk):
         
         # Hours dropdown
         ttk.Label(reminder_frame, text="Hours:").pack(side=tk.LEFT, padx=(0, 5))
-        reminder_hours_options = [str(i) for i in range(0, 24)]
         self.reminder_hours = tk.StringVar(self)
-        self.reminder_hours.set("1")
-        hours_menu = ttk.OptionMenu(reminder_frame, self.reminder_hours, *reminder_hours_options)
+        hours_menu = ttk.OptionMenu(reminder_frame, self.reminder_hours, "1", *_HOURS)
         hours_menu.pack(side=tk.LEFT, padx=(0, 10))
         
         # Minutes dropdown
         ttk.Label(reminder_frame, text="Minutes:").pack(side=tk.LEFT, padx=(0, 5))
-        reminder_minutes_options = [str(i) for i in range(0, 60, 5)]  # 5-minute intervals
         self.reminder_minutes = tk.StringVar(self)
-        self.reminder_minutes.set("0")
-        minutes_menu = ttk.OptionMenu(reminder_frame, self.reminder_minutes, *reminder_minutes_options)
+        minutes_menu = ttk.OptionMenu(reminder_frame, self.reminder_minutes, "0", *_MINUTES)
         minutes_menu.pack(side=tk.LEFT)
         
         self.add_button = ttk.Button(input_frame, text="Add Task", command=self.add_task)
@@ -120,12 +184,25 @@ class ToDoApp(tk.Tk):
         # Configure a tag for completed tasks (strikethrough)
         self.task_tree.tag_configure("completed", font=("Helvetica", 10, "overstrike"))
         
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(task_list_frame, orient=tk.VERTICAL, command=self.task_tree.yview)
-        self.task_tree.configure(yscroll=scrollbar.set)
+        # Add a scrollbar. The Treeview only holds the rows in view, so the
+        # scrollbar tracks our position in self.tasks rather than the tree's yview
+        self.scrollbar = ttk.Scrollbar(task_list_frame, orient=tk.VERTICAL, command=self._on_scroll)
+        self.task_tree.configure(yscrollcommand=self._on_tree_yview)
         
         self.task_tree.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.task_tree.bind("<Configure>", self._on_tree_configure)
+        # Keyboard navigation moves the virtual window itself; the tree's own
+        # bindings can only reach the rows that happen to be materialized
+        self.task_tree.bind("<Up>", lambda event: self._on_tree_key(-1))
+        self.task_tree.bind("<Down>", lambda event: self._on_tree_key(1))
+        self.task_tree.bind("<Prior>", lambda event: self._on_tree_key(-self._visible_rows))
+        self.task_tree.bind("<Next>", lambda event: self._on_tree_key(self._visible_rows))
+        self.task_tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.task_tree.bind("<Button-4>", self._on_mousewheel)
+        self.task_tree.bind("<Button-5>", self._on_mousewheel)
+        self.task_tree.bind("<<TreeviewSelect>>", self._on_tree_select)
 
         # --- Action Buttons ---
         button_frame = ttk.Frame(main_frame)
@@ -158,9 +235,9 @@ class ToDoApp(tk.Tk):
             messagebox.showwarning("Input Error", "Invalid deadline format. Please use DD/MM HH:MM.")
             return
 
-        # Generate unique ID based on current timestamp
-        import time
-        task_id = str(int(time.time() * 1000))  # millisecond timestamp
+        # Generate unique ID from the current timestamp plus a per-session
+        # counter, so tasks added within the same instant never collide
+        task_id = f"{time.time_ns()}_{next(self._id_counter)}"
         
         new_task = {
             "id": task_id,
@@ -170,9 +247,19 @@ class ToDoApp(tk.Tk):
             "completed": False,
             "reminded": False
         }
-        self.tasks.append(new_task)
-        self.save_tasks()
+        self.cache_task_times(new_task)
+        # Keep the list sorted by deadline so it never needs a full re-sort
+        index = bisect.bisect_right(self.tasks, _deadline_key(new_task), key=_deadline_key)
+        self.tasks.insert(index, new_task)
+        self._pending_count += 1
+        self._max_reminder_lead = max(self._max_reminder_lead, deadline - reminder_time)
+        self.tasks_by_id[task_id] = new_task
+        self._mark_dirty()
+        # Bring the new task into view if it landed outside the visible rows
+        if not self._scroll_start <= index < self._scroll_start + self._visible_rows:
+            self._scroll_start = index
         self.refresh_task_list()
+        self._schedule_next_reminder()
         
         # Clear entry fields
         self.task_entry.delete(0, tk.END)
@@ -181,25 +268,17 @@ class ToDoApp(tk.Tk):
 
     def edit_task(self):
         """Allows the user to edit the selected task."""
-        selected_items = self.task_tree.selection()
-        if not selected_items:
+        selected_item = self._selected_task_id()
+        if selected_item is None:
             messagebox.showwarning("Selection Error", "Please select a task to edit.")
             return
 
-        # Get the index of the selected item
-        selected_item = selected_items[0]
-        try:
-            all_items = self.task_tree.get_children()
-            selected_index = all_items.index(selected_item)
-        except ValueError:
+        # Rows are keyed by task id, so the selection maps straight to the task
+        selected_task = self.tasks_by_id.get(selected_item)
+        if selected_task is None:
             messagebox.showerror("Error", "Could not find the selected task.")
             return
-        
-        if selected_index >= len(self.tasks):
-            messagebox.showerror("Error", "Selected task index is out of range.")
-            return
             
-        selected_task = self.tasks[selected_index]
         original_task_text = selected_task["task"]
         
         edit_window = tk.Toplevel(self)
@@ -215,8 +294,8 @@ class ToDoApp(tk.Tk):
             new_text = new_task_entry.get().strip()
             if new_text:
                 selected_task["task"] = new_text
-                self.save_tasks()
-                self.refresh_task_list()
+                self._mark_dirty()
+                self._refresh_changed_rows([selected_task])
                 edit_window.destroy()
                 messagebox.showinfo("Success", "Task updated successfully!")
             else:
@@ -226,126 +305,298 @@ class ToDoApp(tk.Tk):
 
     def delete_task(self):
         """Deletes the selected task from the list."""
-        selected_items = self.task_tree.selection()
-        if not selected_items:
+        selected_item = self._selected_task_id()
+        if selected_item is None:
             messagebox.showwarning("Selection Error", "Please select a task to delete.")
             return
         
-        # Get the index of the selected item
-        selected_item = selected_items[0]
-        try:
-            all_items = self.task_tree.get_children()
-            selected_index = all_items.index(selected_item)
-        except ValueError:
+        # Rows are keyed by task id, so the selection maps straight to the task
+        selected_task = self.tasks_by_id.get(selected_item)
+        if selected_task is None:
             messagebox.showerror("Error", "Could not find the selected task.")
             return
-        
-        if selected_index >= len(self.tasks):
-            messagebox.showerror("Error", "Selected task index is out of range.")
-            return
             
-        task_text = self.tasks[selected_index]["task"]
+        task_text = selected_task["task"]
         
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{task_text}'?"):
-            del self.tasks[selected_index]
-            self.save_tasks()
+            self.tasks.remove(selected_task)
+            if _is_pending(selected_task):
+                self._pending_count -= 1
+            del self.tasks_by_id[selected_item]
+            self._mark_dirty()
+            self._selected_id = None
             self.refresh_task_list()
+            self._schedule_next_reminder()
             messagebox.showinfo("Success", "Task deleted successfully!")
 
     def mark_completed(self):
         """Toggles the completion status of the selected task."""
-        selected_items = self.task_tree.selection()
-        if not selected_items:
+        selected_item = self._selected_task_id()
+        if selected_item is None:
             messagebox.showwarning("Selection Error", "Please select a task to mark as completed.")
             return
 
-        # Get the index of the selected item
-        selected_item = selected_items[0]
-        try:
-            all_items = self.task_tree.get_children()
-            selected_index = all_items.index(selected_item)
-        except ValueError:
+        # Rows are keyed by task id, so the selection maps straight to the task
+        selected_task = self.tasks_by_id.get(selected_item)
+        if selected_task is None:
             messagebox.showerror("Error", "Could not find the selected task.")
             return
-        
-        if selected_index >= len(self.tasks):
-            messagebox.showerror("Error", "Selected task index is out of range.")
-            return
             
-        selected_task = self.tasks[selected_index]
+        was_pending = _is_pending(selected_task)
         selected_task["completed"] = not selected_task["completed"]
-        self.save_tasks()
-        self.refresh_task_list()
+        self._pending_count += _is_pending(selected_task) - was_pending
+        self._mark_dirty()
+        self._refresh_changed_rows([selected_task])
+        self._schedule_next_reminder()
         status = "completed" if selected_task["completed"] else "pending"
         messagebox.showinfo("Success", f"Task marked as {status}!")
 
     def reset_reminder(self):
         """Resets the reminder status for the selected task."""
-        selected_items = self.task_tree.selection()
-        if not selected_items:
+        selected_item = self._selected_task_id()
+        if selected_item is None:
             messagebox.showwarning("Selection Error", "Please select a task to reset reminder.")
             return
 
-        # Get the index of the selected item
-        selected_item = selected_items[0]
-        try:
-            all_items = self.task_tree.get_children()
-            selected_index = all_items.index(selected_item)
-        except ValueError:
+        # Rows are keyed by task id, so the selection maps straight to the task
+        selected_task = self.tasks_by_id.get(selected_item)
+        if selected_task is None:
             messagebox.showerror("Error", "Could not find the selected task.")
             return
-        
-        if selected_index >= len(self.tasks):
-            messagebox.showerror("Error", "Selected task index is out of range.")
-            return
             
-        selected_task = self.tasks[selected_index]
-        
         if selected_task.get("reminded", False):
             selected_task["reminded"] = False
-            self.save_tasks()
-            self.refresh_task_list()
+            if not selected_task["completed"]:
+                self._pending_count += 1
+            self._mark_dirty()
+            self._refresh_changed_rows([selected_task])
+            self._schedule_next_reminder()
             messagebox.showinfo("Reminder Reset", "Reminder status has been reset. You will be reminded again when the time comes.")
         else:
             messagebox.showinfo("No Action Needed", "This task hasn't been reminded yet.")
 
     def sort_tasks(self):
         """Sorts tasks by their deadline."""
-        self.tasks.sort(key=lambda t: datetime.fromisoformat(t["deadline"]))
+        # self.tasks is already kept in deadline order; just repaint
         self.refresh_task_list()
         messagebox.showinfo("Tasks Sorted", "Tasks have been sorted by their deadline.")
 
+    def task_row(self, task):
+        """Returns the Treeview (values, tags) pair for a single task."""
+        # Completed tasks get the strikethrough tag
+        tags = ("completed",) if task["completed"] else ()
+        status = "Completed" if task["completed"] else ("Reminded" if task.get("reminded", False) else "Pending")
+        return (task["task"], task["_deadline_str"], task["_reminder_str"], status), tags
+
     def refresh_task_list(self):
-        """Clears and re-populates the Treeview with current task data."""
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
-            
-        for task in self.tasks:
-            # Determine status text
-            if task["completed"]:
-                status = "Completed"
-            elif task.get("reminded", False):
-                status = "Reminded"
-            else:
-                status = "Pending"
-                
-            task_info = (
-                task["task"],
-                datetime.fromisoformat(task["deadline"]).strftime("%d/%m %H:%M"),
-                datetime.fromisoformat(task["reminder_time"]).strftime("%d/%m %H:%M"),
-                status
-            )
-            
-            # Apply strikethrough tag if completed
-            if task["completed"]:
-                self.task_tree.insert("", "end", values=task_info, tags=("completed",))
-            else:
-                self.task_tree.insert("", "end", values=task_info)
+        """Clears and re-populates the visible part of the Treeview."""
+        # A single delete call clears every row in one Tk round-trip
+        self.task_tree.delete(*self.task_tree.get_children())
+        self._row_window = (0, 0)
+        self._materialize_window()
+
+    def _materialize_window(self):
+        """Keeps only the tasks in (or just below) the viewport as Treeview rows."""
+        # Diffs against the previous window, so the rows must still match
+        # self.tasks[old_start:old_end]; adding or removing tasks goes through
+        # refresh_task_list instead
+        total = len(self.tasks)
+        start = max(0, min(self._scroll_start, total - self._visible_rows))
+        end = min(total, start + self._visible_rows + ROW_OVERSCAN)
+        old_start, old_end = self._row_window
+        self._scroll_start = start
+        self._row_window = (start, end)
+        
+        if start >= old_end or old_start >= end:
+            # No overlap with the previous window: replace every row
+            self.task_tree.delete(*self.task_tree.get_children())
+            for task in self.tasks[start:end]:
+                self._insert_row("end", task)
+        else:
+            # Only touch the rows that scrolled out or in at either edge
+            stale = [task["id"] for task in self.tasks[old_start:start]]
+            stale += [task["id"] for task in self.tasks[end:old_end]]
+            if stale:
+                self.task_tree.delete(*stale)
+            for position, task in enumerate(self.tasks[start:old_start]):
+                self._insert_row(position, task)
+            for task in self.tasks[old_end:end]:
+                self._insert_row("end", task)
+        
+        if (self._selected_id is not None and not self.task_tree.selection()
+                and self.task_tree.exists(self._selected_id)):
+            self.task_tree.selection_set(self._selected_id)
+        
+        if total:
+            self.scrollbar.set(start / total, min(total, start + self._visible_rows) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _insert_row(self, position, task):
+        """Inserts the Treeview row for a task at the given position."""
+        values, tags = self.task_row(task)
+        self.task_tree.insert("", position, iid=task["id"], values=values, tags=tags)
+
+    def _scroll_to(self, start):
+        """Moves the first visible row to the given task index."""
+        if start != self._scroll_start:
+            self._scroll_start = start
+            self._materialize_window()
+
+    def _on_scroll(self, action, amount, unit=None):
+        """Handles scrollbar drags and arrow clicks."""
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self.tasks)))
+        elif unit == "pages":
+            self._scroll_to(self._scroll_start + int(amount) * self._visible_rows)
+        else:
+            self._scroll_to(self._scroll_start + int(amount))
+
+    def _on_mousewheel(self, event):
+        """Scrolls the virtual list instead of the Treeview's own rows."""
+        if event.num == 4 or event.delta > 0:
+            step = -3
+        else:
+            step = 3
+        self._scroll_to(max(0, self._scroll_start + step))
+        return "break"
+
+    def _on_tree_key(self, step):
+        """Moves the selection by step rows, scrolling the window to keep it in view."""
+        total = len(self.tasks)
+        if not total:
+            return "break"
+        
+        # Start from the focused row, or the remembered selection if that row
+        # has been scrolled out (and deleted) since
+        index = self._task_index(self.task_tree.focus() or self._selected_id)
+        if index is None:
+            target = self._scroll_start
+        else:
+            target = max(0, min(total - 1, index + step))
+        
+        if target < self._scroll_start:
+            self._scroll_to(target)
+        elif target >= self._scroll_start + self._visible_rows:
+            self._scroll_to(target - self._visible_rows + 1)
+        
+        target_id = self.tasks[target]["id"]
+        self.task_tree.selection_set(target_id)
+        self.task_tree.focus(target_id)
+        return "break"
+
+    def _task_index(self, task_id):
+        """Returns the position of a task in self.tasks, or None if it is unknown."""
+        rows = self.task_tree.get_children()
+        if task_id in rows:
+            return self._row_window[0] + rows.index(task_id)
+        task = self.tasks_by_id.get(task_id)
+        if task is None:
+            return None
+        return self.tasks.index(task)
+
+    def _on_tree_configure(self, event):
+        """Re-measures the visible rows once ttk has laid out the resized tree."""
+        # Resizing does not always change the scroll fractions, so the
+        # yscrollcommand hook alone may not run; repeat until the count settles
+        while True:
+            visible_rows = self._visible_rows
+            self.task_tree.update_idletasks()
+            self._on_tree_yview(*self.task_tree.yview())
+            if self._visible_rows == visible_rows:
+                break
+
+    def _on_tree_yview(self, first, last):
+        """Measures how many rows fit and keeps the tree's own view at the top."""
+        rows = len(self.task_tree.get_children())
+        if not rows:
+            return
+        first, last = float(first), float(last)
+        
+        if first > 0:
+            # The tree scrolled itself; turn that offset into a new window start
+            self.task_tree.yview_moveto(0)
+            self._scroll_to(self._scroll_start + round(first * rows))
+            return
+        
+        # Tk reports how many whole rows are on screen as the "last" fraction,
+        # which accounts for the real row height, headings and borders
+        height = self.task_tree.winfo_height()
+        if last < 1:
+            visible_rows = max(1, round(last * rows))
+            self._measured_height = height
+        elif self._row_window != (0, len(self.tasks)) and height != self._measured_height:
+            # Every materialized row fits and the tree has been resized since the
+            # last exact measurement; grow until rows overflow the viewport again
+            visible_rows = rows + ROW_OVERSCAN
+        else:
+            return
+        if visible_rows != self._visible_rows:
+            # Keep the last task in view if the list was scrolled to the bottom
+            if 0 < self._scroll_start and self._scroll_start + self._visible_rows >= len(self.tasks):
+                self._scroll_start = len(self.tasks)
+            self._visible_rows = visible_rows
+            self._materialize_window()
+
+    def _on_tree_select(self, event):
+        """Remembers the selected task so it survives being scrolled out of view."""
+        selected_items = self.task_tree.selection()
+        if selected_items:
+            self._selected_id = selected_items[0]
+        elif self._selected_id is not None and self.task_tree.exists(self._selected_id):
+            # The row is still shown, so the user really cleared the selection
+            self._selected_id = None
+
+    def _selected_task_id(self):
+        """Returns the selected task id, even if its row is scrolled out of view."""
+        selected_items = self.task_tree.selection()
+        if selected_items:
+            return selected_items[0]
+        if self._selected_id in self.tasks_by_id:
+            return self._selected_id
+        return None
+
+    def _refresh_changed_rows(self, tasks):
+        """Updates the Treeview rows of the given tasks in place."""
+        for task in tasks:
+            # Tasks outside the visible window have no row to update
+            if self.task_tree.exists(task["id"]):
+                values, tags = self.task_row(task)
+                self.task_tree.item(task["id"], values=values, tags=tags)
 
     def save_tasks(self):
         """Saves the current task list to a JSON file."""
         with open(self.task_file, "w") as f:
-            json.dump(self.tasks, f, indent=4)
+            # Underscore-prefixed keys are runtime caches and are not persisted
+            json.dump([{k: v for k, v in t.items() if not k.startswith("_")} for t in self.tasks], f,
+                      separators=(",", ":"))
+        self._dirty = False
+
+    def _mark_dirty(self):
+        """Flags unsaved changes and schedules a single deferred save."""
+        self._dirty = True
+        if self._save_after_id is None:
+            self._save_after_id = self.after(SAVE_DELAY_MS, self._flush_if_dirty)
+
+    def _flush_if_dirty(self):
+        """Writes the task list to disk if anything changed since the last save."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._dirty:
+            self.save_tasks()
+
+    def _on_close(self):
+        """Flushes pending changes before closing the window."""
+        self._flush_if_dirty()
+        self.destroy()
+
+    def cache_task_times(self, task):
+        """Parses a task's ISO timestamps once and caches the results on the task."""
+        task["_deadline_dt"] = datetime.fromisoformat(task["deadline"])
+        task["_reminder_dt"] = datetime.fromisoformat(task["reminder_time"])
+        task["_deadline_str"] = task["_deadline_dt"].strftime("%d/%m %H:%M")
+        task["_reminder_str"] = task["_reminder_dt"].strftime("%d/%m %H:%M")
 
     def load_tasks(self):
         """Loads tasks from a JSON file, or returns an empty list if not found."""
@@ -353,54 +604,81 @@ class ToDoApp(tk.Tk):
             with open(self.task_file, "r") as f:
                 tasks = json.load(f)
                 # Ensure all tasks have required fields for backward compatibility
-                import time
                 for i, task in enumerate(tasks):
                     if "reminded" not in task:
                         task["reminded"] = False
                     if "id" not in task:
                         # Generate unique ID for existing tasks
-                        task["id"] = f"legacy_{i}_{int(time.time() * 1000)}"
+                        task["id"] = f"legacy_{i}_{time.time_ns() // 1_000_000}"
+                    self.cache_task_times(task)
+                tasks.sort(key=_deadline_key)
                 return tasks
         return []
 
     def check_reminders(self):
         """Checks for upcoming reminders and triggers notifications."""
+        # Nothing left to remind about; adding or resetting a task re-arms the timer
+        if self._pending_count == 0:
+            return
+        
         now = datetime.now()
+        changed_tasks = []
         
+        horizon = now + self._max_reminder_lead
         for task in self.tasks:
-            if not task["completed"] and not task.get("reminded", False):
-                try:
-                    reminder_time = datetime.fromisoformat(task["reminder_time"])
-                    if now >= reminder_time:
-                        self.trigger_reminder(task)
-                        
-                        # Mark task as reminded to prevent repeated reminders
-                        # Task remains incomplete until user manually marks it done
-                        task["reminded"] = True
-                except ValueError:
-                    # Skip tasks with invalid datetime format
-                    continue
-        
-        self.save_tasks()
-        self.refresh_task_list()
+            # Tasks are in deadline order, so once a deadline is beyond the
+            # longest reminder lead of any task, no later task can be due yet
+            if task["_deadline_dt"] > horizon:
+                break
+            if _is_pending(task):
+                if now >= task["_reminder_dt"]:
+                    self.trigger_reminder(task)
+                    
+                    # Mark task as reminded to prevent repeated reminders
+                    # Task remains incomplete until user manually marks it done
+                    task["reminded"] = True
+                    self._pending_count -= 1
+                    changed_tasks.append(task)
+        
+        # Only touch the file and the Treeview when a reminder actually fired
+        if changed_tasks:
+            self._mark_dirty()
+            self._refresh_changed_rows(changed_tasks)
+        
+        self._schedule_next_reminder()
+
+    def _schedule_next_reminder(self):
+        """Arms a single timer for the soonest pending reminder instead of polling."""
+        if self._reminder_after_id is not None:
+            self.after_cancel(self._reminder_after_id)
+            self._reminder_after_id = None
         
-        # Schedule the next check in 1 second
-        self.after(1000, self.check_reminders)
+        if self._pending_count == 0:
+            return
+        pending = [task["_reminder_dt"] for task in self.tasks if _is_pending(task)]
+        
+        # Round up so the timer never fires just before the reminder is due
+        delay = max(0, math.ceil((min(pending) - datetime.now()).total_seconds() * 1000))
+        # Re-check at least hourly so far-off reminders survive clock changes
+        # and stay within Tk's 32-bit "after" delay
+        delay = min(delay, REMINDER_MAX_WAIT_MS)
+        self._reminder_after_id = self.after(delay, self.check_reminders)
 
     def trigger_reminder(self, task):
         """Triggers the reminder notifications."""
         
         task_name = task["task"]
-        deadline = datetime.fromisoformat(task["deadline"]).strftime("%d/%m %H:%M")
+        deadline = task["_deadline_str"]
         
-        # --- Alarm Sound (in a new thread to prevent UI freeze) ---
-        threading.Thread(target=self.play_alarm_sound).start()
+        # --- Alarm Sound (all sound backends play asynchronously) ---
+        self.play_alarm_sound()
         
-        # --- In-app Popup Message ---
-        messagebox.showinfo("REMINDER", f"Task: {task_name}\n\nDeadline: {deadline}")
+        # --- In-app Popup Message (queued so the reminder check never blocks) ---
+        self._pending_popups.append((task_name, deadline))
+        self.after_idle(self._drain_popups)
         
         # --- Desktop Notification (if plyer is available) ---
-        if PLYER_AVAILABLE:
+        if _ensure_notifier():
             notification_title = "To-Do Reminder"
             notification_message = f"Reminder for '{task_name}'! Deadline is at {deadline}."
             notification.notify(
@@ -409,19 +687,54 @@ class ToDoApp(tk.Tk):
                 timeout=10
             )
 
+    def _drain_popups(self):
+        """Shows the next queued reminder in a non-modal window, one at a time."""
+        if self._popup_window is not None or not self._pending_popups:
+            return
+        
+        task_name, deadline = self._pending_popups.popleft()
+        popup = tk.Toplevel(self)
+        popup.title("REMINDER")
+        popup.resizable(False, False)
+        
+        ttk.Label(popup, text=f"Task: {task_name}\n\nDeadline: {deadline}", padding="15").pack()
+        
+        def dismiss():
+            popup.destroy()
+            self._popup_window = None
+            self._drain_popups()
+        
+        ttk.Button(popup, text="OK", command=dismiss).pack(pady=(0, 10))
+        popup.protocol("WM_DELETE_WINDOW", dismiss)
+        popup.lift()
+        self._popup_window = popup
+
+    def load_alarm_sound(self):
+        """Loads reminder.wav once so each reminder can play it without disk I/O."""
+        if os.path.exists("reminder.wav"):
+            try:
+                return pygame.mixer.Sound("reminder.wav")
+            except Exception as e:
+                print(f"Could not load reminder.wav. Error: {e}")
+        return None
+
     def play_alarm_sound(self):
         """Plays a sound file using available sound libraries."""
         try:
-            if PYGAME_AVAILABLE:
-                # Try to play with pygame first
-                if os.path.exists("reminder.wav"):
-                    pygame.mixer.music.load("reminder.wav")
-                    pygame.mixer.music.play()
+            if _ensure_audio():
+                # Load reminder.wav on the first reminder, then reuse it
+                if not self._alarm_sound_loaded:
+                    self._alarm_sound = self.load_alarm_sound()
+                    self._alarm_sound_loaded = True
+                # Try to play the preloaded sound with pygame first
+                if self._alarm_sound:
+                    self._alarm_sound.play()
                 else:
                     # Play a default system sound with pygame
                     print("reminder.wav not found, using system beep")
                     if WINSOUND_AVAILABLE:
-                        winsound.Beep(1000, 500)  # 1000 Hz for 500ms
+                        # Beep() blocks the Tk loop; play the system alias asynchronously
+                        winsound.PlaySound("SystemExclamation", winsound.SND_ASYNC | winsound.SND_ALIAS)
             elif WINSOUND_AVAILABLE:
                 # Fallback to Windows system sound
                 winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
@@ -435,31 +748,11 @@ class ToDoApp(tk.Tk):
 
     def update_clock(self):
         """Updates the current date and time displayed in the header."""
-        now = datetime.now().strftime("%A, %B %d, %Y - %I:%M %p")
-        self.clock_label.config(text=now)
-        self.after(1000, self.update_clock)
-
-    def get_selected_task(self):
-        """Helper method to get the selected task from the treeview."""
-        selected_items = self.task_tree.selection()
-        if not selected_items:
-            return None
-        
-        # Get the first selected item
-        selected_item = selected_items[0]
-        
-        # Get the index of the selected item in the treeview
-        try:
-            all_items = self.task_tree.get_children()
-            selected_index = all_items.index(selected_item)
-            
-            # Return the corresponding task from our task list
-            if 0 <= selected_index < len(self.tasks):
-                return self.tasks[selected_index]
-        except (ValueError, IndexError):
-            pass
-            
-        return None
+        now = datetime.now()
+        self.clock_label.config(text=now.strftime("%A, %B %d, %Y - %I:%M %p"))
+        # The display only shows minutes, so wake up at the start of the next one
+        ms_to_next_min = (60 - now.second) * 1000 - now.microsecond // 1000
+        self.after(ms_to_next_min, self.update_clock)
 
 if __name__ == "__main__":
     app = ToDoApp()